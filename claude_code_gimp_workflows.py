@@ -5,64 +5,236 @@ Advanced automation scripts for GIMP via MCP
 """
 
 import asyncio
+import base64
+import itertools
 import json
-from typing import Dict, List, Any
+import os
+from typing import Dict, Iterator, List, Any
 from pathlib import Path
 
+
+def iter_images(directory: str) -> Iterator[Path]:
+    """Yield image files from a directory in one os.scandir pass.
+
+    Lazy enumeration lets batch pipelines start processing before the
+    full directory listing is materialized.
+    """
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.is_file() and entry.name.lower().endswith((".jpg", ".jpeg", ".png")):
+                yield Path(entry.path)
+
+# Optional uvloop event loop for lower per-await overhead on the many
+# short call_tool round-trips these workflows issue
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
+# Optional Numba/NumPy acceleration for procedural textures
+try:
+    import numpy as np
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _noise_texture(width, height, seed):
+        """Fill an RGB buffer with hash-based noise, parallel over rows"""
+        buf = np.empty((height, width, 3), np.uint8)
+        for y in prange(height):
+            for x in range(width):
+                for c in range(3):
+                    n = (x * 374761393 + y * 668265263 +
+                         c * 2246822519 + seed * 3266489917) & 0xFFFFFFFF
+                    n = ((n ^ (n >> 13)) * 1274126177) & 0xFFFFFFFF
+                    buf[y, x, c] = (n ^ (n >> 16)) & 0xFF
+        return buf
+
 class GimpWorkflowManager:
     """Manages complex GIMP workflows through Claude Code"""
-    
+
     def __init__(self, mcp_client):
         self.mcp = mcp_client
-        
+        self._jobs: Dict[str, asyncio.Task] = {}
+        self._job_counter = itertools.count(1)
+
+    def submit_workflow(self, coro) -> str:
+        """Schedule a workflow coroutine in the background.
+
+        Returns a polling token immediately instead of blocking the
+        caller for the duration of the pixel work, so batch pipelines
+        can be enqueued in O(1) and tracked via poll_workflow().
+        """
+        job_id = f"job-{next(self._job_counter)}"
+        self._jobs[job_id] = asyncio.create_task(coro)
+        return job_id
+
+    async def poll_workflow(self, job_id: str) -> Dict[str, Any]:
+        """Check the status of a background workflow job"""
+        task = self._jobs.get(job_id)
+        if task is None:
+            return {"status": "unknown", "job_id": job_id}
+        if not task.done():
+            return {"status": "running", "job_id": job_id}
+        del self._jobs[job_id]
+        try:
+            return {"status": "done", "job_id": job_id, "result": task.result()}
+        except Exception as e:
+            return {"status": "failed", "job_id": job_id, "error": str(e)}
+
+    async def _batch(self, calls: List[Dict[str, Any]]) -> List[Any]:
+        """Dispatch several independent tool calls in a single round-trip.
+
+        Tries the server-side "call_tools_batch" tool first so the whole
+        group travels as one JSON-RPC request. An unsupported tool does
+        not raise - the server answers with "Unknown tool" text - so the
+        reply is inspected, and only that case falls back to dispatching
+        the calls individually with asyncio.gather. A batch that fails
+        partway is returned as-is rather than re-executed.
+        """
+        result = await self.mcp.call_tool("call_tools_batch", {"batch": calls})
+        text = result[0].text if result else ""
+        if text.startswith("Unknown tool"):
+            return await asyncio.gather(
+                *(self.mcp.call_tool(call["tool"], call["arguments"]) for call in calls)
+            )
+        # A conforming batch tool answers with one content item per
+        # call; hand them back per call so callers can index their step
+        return list(result)
+
+    # Pixel buffers at or above this size go through shared memory
+    # instead of being base64-encoded into the MCP JSON channel
+    _SHM_THRESHOLD = 1 << 20
+
+    async def _upload_pixels(self, pixels, width: int, height: int) -> None:
+        """Ship a raw RGB buffer to the server, zero-copy when large.
+
+        Small buffers travel base64-encoded over MCP; large ones are
+        placed in POSIX shared memory and only the segment name crosses
+        the wire, avoiding encode and copy costs for W*H*3 bytes.
+        """
+        raw = pixels.tobytes()
+        if len(raw) >= self._SHM_THRESHOLD:
+            from multiprocessing import shared_memory
+            shm = shared_memory.SharedMemory(create=True, size=len(raw))
+            try:
+                shm.buf[:len(raw)] = raw
+                await self.mcp.call_tool("ingest_shm", {
+                    "name": shm.name,
+                    "width": width,
+                    "height": height,
+                    "dtype": "uint8"
+                })
+            finally:
+                shm.close()
+                shm.unlink()
+        else:
+            await self.mcp.call_tool("upload_pixels", {
+                "width": width,
+                "height": height,
+                "pixels": base64.b64encode(raw).decode("ascii")
+            })
+
+    @classmethod
+    def _sexpr(cls, value) -> str:
+        """Render a Python value as a Script-Fu literal.
+
+        JSON syntax is not Script-Fu: booleans become TRUE/FALSE,
+        sequences become (list ...) forms and dicts become association
+        lists of (cons "key" value) pairs.
+        """
+        if isinstance(value, bool):
+            return "TRUE" if value else "FALSE"
+        if isinstance(value, (int, float)):
+            return repr(value)
+        if isinstance(value, str):
+            escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+            return f'"{escaped}"'
+        if isinstance(value, (list, tuple)):
+            return "(list " + " ".join(cls._sexpr(v) for v in value) + ")"
+        if isinstance(value, dict):
+            return "(list " + " ".join(
+                f'(cons {cls._sexpr(str(k))} {cls._sexpr(v)})'
+                for k, v in value.items()) + ")"
+        raise TypeError(f"Cannot render {type(value).__name__} as Script-Fu")
+
+    def compile_workflow(self, steps: List[Dict[str, Any]]) -> str:
+        """Serialize a list of tool steps into one Script-Fu batch script.
+
+        Each {tool, arguments} step becomes a single s-expression; the
+        whole workflow then travels in one MCP call instead of one
+        round-trip (and one GIMP lock/unlock cycle) per step.
+        """
+        exprs = []
+        for step in steps:
+            args = " ".join(self._sexpr(v) for v in step["arguments"].values())
+            exprs.append(f"({step['tool'].replace('_', '-')} {args})".rstrip())
+        return " ".join(exprs)
+
+    async def run_script(self, steps: List[Dict[str, Any]]) -> Any:
+        """Compile the steps into a Script-Fu macro and run it remotely"""
+        return await self.mcp.call_tool(
+            "run_script_fu", {"script": self.compile_workflow(steps)})
+
+    async def call_tool_structured(self, tool: str, arguments: Dict[str, Any]) -> Any:
+        """Call a tool and return its result as structured data.
+
+        Prefers the already-deserialized payload when the client exposes
+        one (result.data), so small metadata queries skip a JSON parse;
+        falls back to decoding the text content.
+        """
+        result = await self.mcp.call_tool(tool, arguments)
+        data = getattr(result, "data", None)
+        if data is not None:
+            return data
+        return json.loads(result[0].text)
+
     async def photo_enhancement_workflow(self, image_path: str, output_path: str) -> Dict[str, Any]:
         """Complete photo enhancement workflow"""
         workflow_steps = []
-        
-        # 1. Open image
+
+        # 1. Open image (must complete before any edits)
         result = await self.mcp.call_tool("open_image", {"filepath": image_path})
         workflow_steps.append(f"Opened: {image_path}")
-        
+
         # 2. Duplicate layer for non-destructive editing
         await self.mcp.call_tool("create_layer", {"name": "Original Copy"})
         workflow_steps.append("Created backup layer")
-        
-        # 3. Basic color correction
-        await self.mcp.call_tool("adjust_colors", {
-            "adjustment": "levels",
-            "parameters": {"shadows": 0.05, "midtones": 1.2, "highlights": 0.95}
-        })
+
+        # 3-7. The three color adjustments run as one server-side chain
+        # (a single GEGL pass over the pixels instead of three); the
+        # remaining filters join them in the same batch round-trip
+        await self._batch([
+            {"tool": "adjust_colors_chain", "arguments": {
+                "steps": [
+                    {"adjustment": "levels",
+                     "parameters": {"shadows": 0.05, "midtones": 1.2, "highlights": 0.95}},
+                    {"adjustment": "brightness-contrast",
+                     "parameters": {"brightness": 5, "contrast": 15}},
+                    {"adjustment": "hue-saturation",
+                     "parameters": {"saturation": 10}}
+                ]
+            }},
+            {"tool": "apply_filter", "arguments": {
+                "filter_name": "noise-reduction",
+                "parameters": {"strength": 0.3}
+            }},
+            {"tool": "apply_filter", "arguments": {
+                "filter_name": "unsharp-mask",
+                "parameters": {"amount": 0.8, "radius": 1.0, "threshold": 0.05}
+            }}
+        ])
         workflow_steps.append("Applied levels adjustment")
-        
-        # 4. Enhance contrast
-        await self.mcp.call_tool("adjust_colors", {
-            "adjustment": "brightness-contrast",
-            "parameters": {"brightness": 5, "contrast": 15}
-        })
         workflow_steps.append("Enhanced contrast")
-        
-        # 5. Color saturation boost
-        await self.mcp.call_tool("adjust_colors", {
-            "adjustment": "hue-saturation",
-            "parameters": {"saturation": 10}
-        })
         workflow_steps.append("Boosted saturation")
-        
-        # 6. Noise reduction
-        await self.mcp.call_tool("apply_filter", {
-            "filter_name": "noise-reduction",
-            "parameters": {"strength": 0.3}
-        })
         workflow_steps.append("Applied noise reduction")
-        
-        # 7. Sharpen for output
-        await self.mcp.call_tool("apply_filter", {
-            "filter_name": "unsharp-mask",
-            "parameters": {"amount": 0.8, "radius": 1.0, "threshold": 0.05}
-        })
         workflow_steps.append("Applied sharpening")
-        
-        # 8. Save enhanced image
+
+        # 8. Save enhanced image (depends on all edits being applied)
         await self.mcp.call_tool("save_image", {"filepath": output_path})
         workflow_steps.append(f"Saved: {output_path}")
         
@@ -77,12 +249,14 @@ class GimpWorkflowManager:
         """Create multiple social media format variants"""
         variants = []
         
-        # Open original image
-        await self.mcp.call_tool("open_image", {"filepath": image_path})
-        
+        # Open original image once; each variant derives from the cached
+        # handle instead of re-decoding the source file per format
+        src_result = await self.mcp.call_tool(
+            "open_image", {"filepath": image_path, "return_handle": True})
+        source_handle = src_result[0].text if src_result else image_path
+
         # Get image info
-        info_result = await self.mcp.call_tool("get_image_info", {})
-        original_info = json.loads(info_result[0].text)
+        original_info = await self.call_tool_structured("get_image_info", {})
         
         # Define social media formats
         formats = {
@@ -93,6 +267,9 @@ class GimpWorkflowManager:
             "linkedin_post": {"width": 1200, "height": 627}
         }
         
+        outdir = Path(output_dir)
+        pending_saves = []
+
         for format_name, dimensions in formats.items():
             # Create new image with specific dimensions
             await self.mcp.call_tool("create_image", {
@@ -106,9 +283,11 @@ class GimpWorkflowManager:
             scale_y = dimensions["height"] / original_info["height"]
             scale = min(scale_x, scale_y)  # Maintain aspect ratio
             
-            # Open and copy original image
-            await self.mcp.call_tool("open_image", {"filepath": image_path})
-            
+            # Duplicate the already-open source instead of reopening it
+            dup_result = await self.mcp.call_tool(
+                "duplicate_image", {"src": source_handle})
+            variant_handle = dup_result[0].text if dup_result else format_name
+
             # Scale to fit
             await self.mcp.call_tool("transform_layer", {
                 "operation": "scale",
@@ -118,53 +297,70 @@ class GimpWorkflowManager:
             # Center the image
             # (This would require more complex positioning logic)
             
-            # Save variant
-            output_path = f"{output_dir}/{format_name}.jpg"
-            await self.mcp.call_tool("save_image", {"filepath": output_path})
-            
+            # Queue the save; all variants are written in one batch call
+            output_path = str(outdir / f"{format_name}.jpg")
+            pending_saves.append({"handle": variant_handle, "filepath": output_path})
+
             variants.append({
                 "format": format_name,
                 "dimensions": dimensions,
                 "output": output_path
             })
-        
+
+        # One write-combined call encodes and saves every variant,
+        # amortizing encoder setup and file syscalls across the batch
+        await self.mcp.call_tool("save_images_batch", {"images": pending_saves})
+
         return variants
     
-    async def batch_watermark_images(self, image_dir: str, watermark_path: str, output_dir: str) -> Dict[str, Any]:
+    async def _watermark_one(self, image_file: Path, watermark_handle: Any,
+                             outdir: Path) -> Dict[str, str]:
+        """Watermark a single image (one unit of the batch workflow)"""
+        # Open image
+        await self.mcp.call_tool("open_image", {"filepath": str(image_file)})
+
+        # Composite the pre-loaded watermark as a new layer
+        await self.mcp.call_tool("apply_cached_layer", {"handle": watermark_handle})
+
+        # Position watermark (bottom right)
+        await self.mcp.call_tool("transform_layer", {
+            "operation": "position",
+            "parameters": {"x": "bottom-right", "margin": 20}
+        })
+
+        # Set watermark opacity
+        await self.mcp.call_tool("adjust_layer_opacity", {"opacity": 70})
+
+        # Flatten image
+        await self.mcp.call_tool("flatten_image", {})
+
+        # Save watermarked image
+        output_path = str(outdir / f"watermarked_{image_file.name}")
+        await self.mcp.call_tool("save_image", {"filepath": output_path})
+
+        return {
+            "original": str(image_file),
+            "watermarked": output_path
+        }
+
+    async def batch_watermark_images(self, image_dir: str, watermark_path: str,
+                                     output_dir: str) -> Dict[str, Any]:
         """Apply watermark to multiple images"""
-        results = []
-        
-        # Get list of images
-        image_files = list(Path(image_dir).glob("*.jpg")) + list(Path(image_dir).glob("*.png"))
-        
-        for image_file in image_files:
-            # Open image
-            await self.mcp.call_tool("open_image", {"filepath": str(image_file)})
-            
-            # Open watermark as new layer
-            await self.mcp.call_tool("open_image", {"filepath": watermark_path})
-            
-            # Position watermark (bottom right)
-            await self.mcp.call_tool("transform_layer", {
-                "operation": "position",
-                "parameters": {"x": "bottom-right", "margin": 20}
-            })
-            
-            # Set watermark opacity
-            await self.mcp.call_tool("adjust_layer_opacity", {"opacity": 70})
-            
-            # Flatten image
-            await self.mcp.call_tool("flatten_image", {})
-            
-            # Save watermarked image
-            output_path = f"{output_dir}/watermarked_{image_file.name}"
-            await self.mcp.call_tool("save_image", {"filepath": output_path})
-            
-            results.append({
-                "original": str(image_file),
-                "watermarked": output_path
-            })
-        
+        # Load the watermark once and reuse the server-side handle for
+        # every image instead of re-opening the file per iteration
+        wm_result = await self.mcp.call_tool(
+            "load_watermark_cached", {"filepath": watermark_path})
+        watermark_handle = wm_result[0].text if wm_result else watermark_path
+
+        # Every step of the pipeline addresses the server's single
+        # current image, so per-image runs must not interleave: keep the
+        # batch sequential (the cached watermark handle is still reused)
+        outdir = Path(output_dir)
+        results = [
+            await self._watermark_one(f, watermark_handle, outdir)
+            for f in iter_images(image_dir)
+        ]
+
         return {
             "workflow": "batch_watermark",
             "processed": len(results),
@@ -181,45 +377,57 @@ class GimpWorkflowManager:
             "name": f"{pattern_type}_texture"
         })
         
+        # Collect the filter steps for the pattern and ship them as one
+        # apply_filter_chain call, letting the server fuse them into a
+        # single GEGL graph pass instead of one image pass per filter
+        filter_chain = []
+
         if pattern_type == "noise":
-            # Generate noise texture
-            await self.mcp.call_tool("apply_filter", {
-                "filter_name": "noise-rgb",
-                "parameters": {"amount": 0.8, "independent": True}
-            })
-            
+            if NUMBA_AVAILABLE:
+                # Generate the noise buffer in-process with the JIT kernel
+                # and upload it once, instead of a remote filter pass
+                pixels = _noise_texture(width, height, 0)
+                await self._upload_pixels(pixels, width, height)
+            else:
+                filter_chain.append({
+                    "filter_name": "noise-rgb",
+                    "parameters": {"amount": 0.8, "independent": True}
+                })
+
             # Add blur for smoothing
-            await self.mcp.call_tool("apply_filter", {
+            filter_chain.append({
                 "filter_name": "gaussian-blur",
                 "parameters": {"radius": 1.5}
             })
-        
+
         elif pattern_type == "wood":
             # Create wood grain texture
-            await self.mcp.call_tool("apply_filter", {
+            filter_chain.append({
                 "filter_name": "render-wood",
                 "parameters": {"rings": 8, "turbulence": 0.1}
             })
-            
+
         elif pattern_type == "marble":
             # Create marble texture
-            await self.mcp.call_tool("apply_filter", {
+            filter_chain.append({
                 "filter_name": "render-marble",
                 "parameters": {"size": 2.0, "turbulence": 1.0}
             })
-        
+
         elif pattern_type == "fabric":
             # Create fabric texture
-            await self.mcp.call_tool("apply_filter", {
+            filter_chain.append({
                 "filter_name": "render-fabric",
                 "parameters": {"weave_type": "plain", "density": 50}
             })
-        
-        # Apply color adjustment for better appearance
-        await self.mcp.call_tool("adjust_colors", {
-            "adjustment": "brightness-contrast",
+
+        # Color adjustment for better appearance joins the same pass
+        filter_chain.append({
+            "filter_name": "brightness-contrast",
             "parameters": {"brightness": -10, "contrast": 20}
         })
+
+        await self.mcp.call_tool("apply_filter_chain", {"filters": filter_chain})
         
         # Save texture
         await self.mcp.call_tool("save_image", {"filepath": output_path})
@@ -234,51 +442,47 @@ class GimpWorkflowManager:
     async def create_logo_mockup(self, logo_path: str, mockup_template: str, output_path: str) -> Dict[str, Any]:
         """Create logo mockup on various surfaces"""
         
-        # Open mockup template
-        await self.mcp.call_tool("open_image", {"filepath": mockup_template})
-        
-        # Create new layer for logo
-        await self.mcp.call_tool("create_layer", {"name": "Logo"})
-        
-        # Open logo image
-        await self.mcp.call_tool("open_image", {"filepath": logo_path})
-        
-        # Scale logo to appropriate size
-        await self.mcp.call_tool("transform_layer", {
-            "operation": "scale",
-            "parameters": {"scale_x": 0.3, "scale_y": 0.3}
-        })
-        
-        # Position logo
-        await self.mcp.call_tool("transform_layer", {
-            "operation": "position",
-            "parameters": {"x": "center", "y": "center"}
-        })
-        
-        # Apply perspective transformation for realism
-        await self.mcp.call_tool("transform_layer", {
-            "operation": "perspective",
-            "parameters": {
-                "corners": [
-                    {"x": 0.1, "y": 0.1},
-                    {"x": 0.9, "y": 0.15},
-                    {"x": 0.85, "y": 0.9},
-                    {"x": 0.15, "y": 0.85}
-                ]
-            }
-        })
-        
-        # Apply blend mode for integration
-        await self.mcp.call_tool("set_layer_blend_mode", {"mode": "multiply"})
-        
-        # Add subtle shadow
-        await self.mcp.call_tool("apply_filter", {
-            "filter_name": "drop-shadow",
-            "parameters": {"offset_x": 2, "offset_y": 2, "blur": 3, "opacity": 0.3}
-        })
-        
-        # Save mockup
-        await self.mcp.call_tool("save_image", {"filepath": output_path})
+        # The whole mockup pipeline is strictly sequential, so compile
+        # it into one Script-Fu macro and ship it in a single call
+        await self.run_script([
+            # Open mockup template
+            {"tool": "open_image", "arguments": {"filepath": mockup_template}},
+            # Create new layer for logo
+            {"tool": "create_layer", "arguments": {"name": "Logo"}},
+            # Open logo image
+            {"tool": "open_image", "arguments": {"filepath": logo_path}},
+            # Scale logo to appropriate size
+            {"tool": "transform_layer", "arguments": {
+                "operation": "scale",
+                "parameters": {"scale_x": 0.3, "scale_y": 0.3}
+            }},
+            # Position logo
+            {"tool": "transform_layer", "arguments": {
+                "operation": "position",
+                "parameters": {"x": "center", "y": "center"}
+            }},
+            # Apply perspective transformation for realism
+            {"tool": "transform_layer", "arguments": {
+                "operation": "perspective",
+                "parameters": {
+                    "corners": [
+                        {"x": 0.1, "y": 0.1},
+                        {"x": 0.9, "y": 0.15},
+                        {"x": 0.85, "y": 0.9},
+                        {"x": 0.15, "y": 0.85}
+                    ]
+                }
+            }},
+            # Apply blend mode for integration
+            {"tool": "set_layer_blend_mode", "arguments": {"mode": "multiply"}},
+            # Add subtle shadow
+            {"tool": "apply_filter", "arguments": {
+                "filter_name": "drop-shadow",
+                "parameters": {"offset_x": 2, "offset_y": 2, "blur": 3, "opacity": 0.3}
+            }},
+            # Save mockup
+            {"tool": "save_image", "arguments": {"filepath": output_path}}
+        ])
         
         return {
             "workflow": "logo_mockup",
@@ -288,45 +492,50 @@ class GimpWorkflowManager:
         }
 
 # Claude Code Integration Examples
+
+# Built once at import; get_example_commands hands out the same mapping
+# instead of re-materializing every list literal per call
+EXAMPLE_COMMANDS = {
+    "basic_operations": [
+        "Create a new 1920x1080 image with white background",
+        "Open the file ~/Desktop/photo.jpg",
+        "Apply gaussian blur with radius 2.5 to current layer",
+        "Adjust brightness by +10 and contrast by +15",
+        "Create a new layer called 'Overlay'",
+        "Save the current image as ~/Desktop/edited.png"
+    ],
+    
+    "advanced_workflows": [
+        "Enhance the photo at ~/photos/portrait.jpg and save as ~/photos/enhanced_portrait.jpg",
+        "Create Instagram and Twitter variants of ~/logos/brand.png",
+        "Batch watermark all images in ~/products/ with ~/assets/watermark.png",
+        "Generate a wood texture pattern 512x512 pixels",
+        "Create a logo mockup using ~/logos/logo.png on ~/templates/tshirt.jpg"
+    ],
+    
+    "creative_tasks": [
+        "Create a vintage photo effect with sepia tones and vignette",
+        "Generate a seamless tile pattern for web backgrounds",
+        "Create a double exposure effect combining two images",
+        "Design a movie poster layout with text and effects",
+        "Create an animated GIF from a series of images"
+    ],
+    
+    "batch_operations": [
+        "Resize all images in ~/photos/ to 800x600 maintaining aspect ratio",
+        "Convert all PNG files in ~/graphics/ to JPEG format",
+        "Apply the same filter preset to all images in a folder",
+        "Create thumbnails for all images in ~/gallery/",
+        "Batch rename and organize images by date taken"
+    ]
+}
+
 class ClaudeCodeGimpCommands:
     """Example commands for Claude Code integration"""
-    
+
     @staticmethod
     def get_example_commands():
-        return {
-            "basic_operations": [
-                "Create a new 1920x1080 image with white background",
-                "Open the file ~/Desktop/photo.jpg",
-                "Apply gaussian blur with radius 2.5 to current layer",
-                "Adjust brightness by +10 and contrast by +15",
-                "Create a new layer called 'Overlay'",
-                "Save the current image as ~/Desktop/edited.png"
-            ],
-            
-            "advanced_workflows": [
-                "Enhance the photo at ~/photos/portrait.jpg and save as ~/photos/enhanced_portrait.jpg",
-                "Create Instagram and Twitter variants of ~/logos/brand.png",
-                "Batch watermark all images in ~/products/ with ~/assets/watermark.png",
-                "Generate a wood texture pattern 512x512 pixels",
-                "Create a logo mockup using ~/logos/logo.png on ~/templates/tshirt.jpg"
-            ],
-            
-            "creative_tasks": [
-                "Create a vintage photo effect with sepia tones and vignette",
-                "Generate a seamless tile pattern for web backgrounds",
-                "Create a double exposure effect combining two images",
-                "Design a movie poster layout with text and effects",
-                "Create an animated GIF from a series of images"
-            ],
-            
-            "batch_operations": [
-                "Resize all images in ~/photos/ to 800x600 maintaining aspect ratio",
-                "Convert all PNG files in ~/graphics/ to JPEG format",
-                "Apply the same filter preset to all images in a folder",
-                "Create thumbnails for all images in ~/gallery/",
-                "Batch rename and organize images by date taken"
-            ]
-        }
+        return EXAMPLE_COMMANDS
 
 # Example Claude Code workflow scripts
 example_workflows = {
@@ -8,6 +8,47 @@ import gi
 gi.require_version('Gimp', '3.0')
 gi.require_version('Gegl', '0.4')
 from gi.repository import Gimp, Gegl
+import numpy as np
+from functools import lru_cache
+
+# Optional Numba acceleration for CPU-side gradient previews
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _linear_gradient(buf, c0, c1, width, height):
+        """Fill buf with a vertical linear gradient, parallel over rows"""
+        for y in prange(height):
+            t = y / (height - 1) if height > 1 else 0.0
+            for x in range(width):
+                for c in range(3):
+                    buf[y, x, c] = c0[c] * (1.0 - t) + c1[c] * t
+
+    @njit(parallel=True, cache=True)
+    def _radial_gradient(buf, c0, c1, width, height):
+        """Fill buf with a center-out radial gradient, parallel over rows"""
+        cx = (width - 1) / 2.0
+        cy = (height - 1) / 2.0
+        radius = min(cx, cy) if min(cx, cy) > 0 else 1.0
+        for y in prange(height):
+            for x in range(width):
+                d = ((x - cx) ** 2 + (y - cy) ** 2) ** 0.5 / radius
+                t = d if d < 1.0 else 1.0
+                for c in range(3):
+                    buf[y, x, c] = c0[c] * (1.0 - t) + c1[c] * t
+
+
+@lru_cache(maxsize=256)
+def _cached_color(name: str) -> Gegl.Color:
+    """Parse a color name/hex once and reuse the Gegl.Color object.
+
+    Cached colors are shared; callers must treat them as read-only.
+    """
+    return Gegl.Color.new(name)
 
 class GIMP3ColorHandler:
     """Handles color operations in GIMP 3.0 using Gegl.Color"""
@@ -54,60 +95,82 @@ class GIMP3ColorHandler:
     
     def color_to_rgb_tuple(self, color: Gegl.Color) -> tuple:
         """Convert Gegl.Color to (r, g, b, a) tuple"""
-        rgba = color.get_rgba()
-        return (rgba[0], rgba[1], rgba[2], rgba[3])
+        return tuple(color.get_rgba())
     
     def color_to_hex(self, color: Gegl.Color) -> str:
         """Convert Gegl.Color to hex string"""
         r, g, b, a = self.color_to_rgb_tuple(color)
-        r_int = int(r * 255)
-        g_int = int(g * 255)
-        b_int = int(b * 255)
+        channels = bytearray((int(r * 255), int(g * 255), int(b * 255)))
         if a < 1.0:
-            a_int = int(a * 255)
-            return f"#{r_int:02x}{g_int:02x}{b_int:02x}{a_int:02x}"
-        else:
-            return f"#{r_int:02x}{g_int:02x}{b_int:02x}"
+            channels.append(int(a * 255))
+        # bytes.hex() formats all channels in one C-level pass instead
+        # of one %02x f-string per channel
+        return "#" + channels.hex()
+
+    def colors_to_hex(self, colors: list) -> list:
+        """Convert many Gegl.Color objects to hex strings in one pass.
+
+        Vectorizes the channel scaling with NumPy and formats via a
+        single bytes.hex() call per color, avoiding per-channel Python
+        arithmetic when converting whole palettes.
+        """
+        if not colors:
+            return []
+        rgba = np.stack([color.get_rgba() for color in colors])
+        packed = (rgba * 255).astype(np.uint8)
+        opaque = rgba[:, 3] >= 1.0
+        return [
+            "#" + (row[:3].tobytes().hex() if is_opaque else row.tobytes().hex())
+            for row, is_opaque in zip(packed, opaque)
+        ]
 
 # Common color constants for GIMP 3.0
+
+# Warm the color cache for the named constants at import so the first
+# white()/black()/... call returns a prebuilt object with no CSS parse
+_COMMON_COLOR_NAMES = ("white", "black", "red", "green", "blue",
+                       "yellow", "cyan", "magenta", "transparent")
+for _name in _COMMON_COLOR_NAMES:
+    _cached_color(_name)
+
 class GIMP3Colors:
     """Common color constants using Gegl.Color"""
     
     @staticmethod
     def white() -> Gegl.Color:
-        return Gegl.Color.new("white")
+        return _cached_color("white")
     
     @staticmethod
     def black() -> Gegl.Color:
-        return Gegl.Color.new("black")
+        return _cached_color("black")
     
     @staticmethod
     def red() -> Gegl.Color:
-        return Gegl.Color.new("red")
+        return _cached_color("red")
     
     @staticmethod
     def green() -> Gegl.Color:
-        return Gegl.Color.new("green")
+        return _cached_color("green")
     
     @staticmethod
     def blue() -> Gegl.Color:
-        return Gegl.Color.new("blue")
+        return _cached_color("blue")
     
     @staticmethod
     def yellow() -> Gegl.Color:
-        return Gegl.Color.new("yellow")
+        return _cached_color("yellow")
     
     @staticmethod
     def cyan() -> Gegl.Color:
-        return Gegl.Color.new("cyan")
+        return _cached_color("cyan")
     
     @staticmethod
     def magenta() -> Gegl.Color:
-        return Gegl.Color.new("magenta")
+        return _cached_color("magenta")
     
     @staticmethod
     def transparent() -> Gegl.Color:
-        return Gegl.Color.new("transparent")
+        return _cached_color("transparent")
     
     @staticmethod
     def gray(lightness: float = 0.5) -> Gegl.Color:
@@ -157,12 +220,27 @@ class GimpMCPServerColorFixed:
             self.color_handler.set_foreground_color(color_obj)
             Gimp.drawable_edit_fill(layer, Gimp.FillType.FOREGROUND)
     
-    async def create_gradient_fill(self, layer: Gimp.Layer, 
+    async def create_gradient_fill(self, layer: Gimp.Layer,
                                  start_color: str, end_color: str,
-                                 gradient_type: str = "linear"):
+                                 gradient_type: str = "linear",
+                                 cpu_preview: bool = False):
         """Fill layer with gradient using GIMP 3.0 colors"""
         start_color_obj = self.color_handler.create_color_from_name(start_color)
         end_color_obj = self.color_handler.create_color_from_name(end_color)
+
+        if cpu_preview and NUMBA_AVAILABLE:
+            # Generate the gradient in-process with the JIT kernels and
+            # hand the buffer back without going through the PDB — used
+            # for offline previews where GIMP rendering isn't needed
+            w, h = layer.get_width(), layer.get_height()
+            c0 = np.array(start_color_obj.get_rgba()[:3], dtype=np.float32)
+            c1 = np.array(end_color_obj.get_rgba()[:3], dtype=np.float32)
+            buf = np.empty((h, w, 3), dtype=np.float32)
+            if gradient_type == "radial":
+                _radial_gradient(buf, c0, c1, w, h)
+            else:
+                _linear_gradient(buf, c0, c1, w, h)
+            return buf
         
         # Set gradient colors
         self.color_handler.set_foreground_color(start_color_obj)
@@ -286,17 +364,20 @@ class CommonColorPalette:
         "accent_bright": "#E74C3C",
         "accent_muted": "#95A5A6"
     }
-    
+
+    # Merged view of all palettes, built once at class definition so
+    # get_color does a single dict lookup instead of re-merging per call
+    _ALL_COLORS = {**WEB_COLORS, **PHOTO_COLORS, **DESIGN_COLORS}
+
     @classmethod
     def get_color(cls, color_name: str) -> Gegl.Color:
         """Get color by name from any palette"""
-        all_colors = {**cls.WEB_COLORS, **cls.PHOTO_COLORS, **cls.DESIGN_COLORS}
-        hex_value = all_colors.get(color_name)
+        hex_value = cls._ALL_COLORS.get(color_name)
         if hex_value:
-            return Gegl.Color.new(hex_value)
+            return _cached_color(hex_value)
         else:
             # Fallback to Gegl color name parsing
-            return Gegl.Color.new(color_name)
+            return _cached_color(color_name)
 
 def main():
     """Main function for testing color operations"""
@@ -7,13 +7,22 @@ GIMP 3.0 API Reference: Uses GObject Introspection bindings
 """
 
 import asyncio
+import concurrent.futures
+import functools
 import json
 import logging
-import os
 import sys
+from contextlib import asynccontextmanager
 from typing import Any, Dict, List, Optional, Sequence
 from pathlib import Path
 
+import anyio
+
+# The Windows proactor loop busy-waits against the synchronous stdio
+# pipes MCP uses; the selector loop idles properly
+if sys.platform == "win32":
+    asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+
 # MCP server dependencies
 from mcp.server import Server
 from mcp.server.models import InitializationOptions
@@ -27,26 +36,396 @@ from mcp.types import (
     CallToolResult
 )
 
-# GIMP 3.0 Python API imports
+# GIMP 3.0 Python API imports are deferred to first use: pulling the
+# typelib graph in costs hundreds of ms, and capability queries
+# (list_tools, schema reads) never touch GIMP
+Gimp = GimpUi = GObject = GLib = Gio = Gegl = None
+GIMP_AVAILABLE = False
+_GI_PROBED = False
+
+def _ensure_gimp() -> bool:
+    """Load the GI bindings on first need and cache the module refs"""
+    global Gimp, GimpUi, GObject, GLib, Gio, Gegl
+    global GIMP_AVAILABLE, _GI_PROBED
+    if _GI_PROBED:
+        return GIMP_AVAILABLE
+    _GI_PROBED = True
+    try:
+        import gi
+        gi.require_version('Gimp', '3.0')
+        gi.require_version('GimpUi', '3.0') 
+        gi.require_version('Gegl', '0.4')
+        from gi.repository import Gimp, GimpUi, GObject, GLib, Gio, Gegl
+        GIMP_AVAILABLE = True
+    except ImportError:
+        print("GIMP 3.0 Python bindings not available")
+    return GIMP_AVAILABLE
+
+# Optional fast JSON codec for resource and image-info payloads
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional libuv-backed event loop; the stock selector loop is the
+# bottleneck once the server is only shuffling stdio JSON frames
 try:
-    import gi
-    gi.require_version('Gimp', '3.0')
-    gi.require_version('GimpUi', '3.0') 
-    gi.require_version('Gegl', '0.4')
-    from gi.repository import Gimp, GimpUi, GObject, GLib, Gio, Gegl
-    GIMP_AVAILABLE = True
+    import uvloop
+    UVLOOP_AVAILABLE = True
 except ImportError:
-    GIMP_AVAILABLE = False
-    print("GIMP 3.0 Python bindings not available")
+    UVLOOP_AVAILABLE = False
+
+def _dump_json(obj, indent: bool = False) -> str:
+    """Serialize with orjson when available, stdlib json otherwise"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    return json.dumps(obj, indent=2 if indent else None)
+
+# Tool descriptors are static data: the JSON-Schema literals are built
+# exactly once at import and shared for the life of the process
+_TOOLS = (
+    Tool(
+        name="create_image",
+        description="Create a new GIMP image",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "width": {"type": "integer", "description": "Image width in pixels"},
+                "height": {"type": "integer", "description": "Image height in pixels"},
+                "name": {"type": "string", "description": "Image name", "default": "Untitled"},
+                "fill_type": {"type": "string", "enum": ["white", "black", "transparent"], "default": "white"}
+            },
+            "required": ["width", "height"]
+        }
+    ),
+    Tool(
+        name="open_image",
+        description="Open an image file in GIMP",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "filepath": {"type": "string", "description": "Path to image file"}
+            },
+            "required": ["filepath"]
+        }
+    ),
+    Tool(
+        name="load_into_image",
+        description="Load a file's pixels into the current image, replacing its layers",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "filepath": {"type": "string", "description": "Path to image file"}
+            },
+            "required": ["filepath"]
+        }
+    ),
+    Tool(
+        name="save_image",
+        description="Save current image to file",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "filepath": {"type": "string", "description": "Output file path"},
+                "export_options": {"type": "object", "description": "Export options (quality, compression, etc.)"}
+            },
+            "required": ["filepath"]
+        }
+    ),
+    Tool(
+        name="create_layer",
+        description="Create a new layer in the current image",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "name": {"type": "string", "description": "Layer name"},
+                "layer_type": {"type": "string", "enum": ["RGB", "RGBA", "GRAY", "GRAYA"], "default": "RGBA"},
+                "opacity": {"type": "number", "minimum": 0, "maximum": 100, "default": 100},
+                "mode": {"type": "string", "description": "Blend mode", "default": "normal"}
+            },
+            "required": ["name"]
+        }
+    ),
+    Tool(
+        name="apply_gaussian_blur",
+        description="Apply Gaussian blur filter",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "radius": {"type": "number", "minimum": 0.1, "maximum": 300, "description": "Blur radius"},
+                "horizontal": {"type": "number", "minimum": 0.1, "maximum": 300, "description": "Horizontal radius (optional)"},
+                "vertical": {"type": "number", "minimum": 0.1, "maximum": 300, "description": "Vertical radius (optional)"}
+            },
+            "required": ["radius"]
+        }
+    ),
+    Tool(
+        name="adjust_brightness_contrast",
+        description="Adjust brightness and contrast",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "brightness": {"type": "number", "minimum": -100, "maximum": 100, "description": "Brightness adjustment"},
+                "contrast": {"type": "number", "minimum": -100, "maximum": 100, "description": "Contrast adjustment"}
+            },
+            "required": ["brightness", "contrast"]
+        }
+    ),
+    Tool(
+        name="adjust_hue_saturation",
+        description="Adjust hue, saturation, and lightness",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hue": {"type": "number", "minimum": -180, "maximum": 180, "description": "Hue adjustment"},
+                "saturation": {"type": "number", "minimum": -100, "maximum": 100, "description": "Saturation adjustment"},
+                "lightness": {"type": "number", "minimum": -100, "maximum": 100, "description": "Lightness adjustment"},
+                "channel": {"type": "string", "enum": ["master", "red", "yellow", "green", "cyan", "blue", "magenta"], "default": "master"}
+            }
+        }
+    ),
+    Tool(
+        name="select_rectangle",
+        description="Create a rectangular selection",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "x": {"type": "number", "description": "X coordinate"},
+                "y": {"type": "number", "description": "Y coordinate"},
+                "width": {"type": "number", "description": "Selection width"},
+                "height": {"type": "number", "description": "Selection height"},
+                "operation": {"type": "string", "enum": ["replace", "add", "subtract", "intersect"], "default": "replace"}
+            },
+            "required": ["x", "y", "width", "height"]
+        }
+    ),
+    Tool(
+        name="scale_image",
+        description="Scale the current image",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "width": {"type": "integer", "minimum": 1, "description": "New width"},
+                "height": {"type": "integer", "minimum": 1, "description": "New height"},
+                "interpolation": {"type": "string", "enum": ["none", "linear", "cubic", "nohalo", "lohalo"], "default": "cubic"}
+            },
+            "required": ["width", "height"]
+        }
+    ),
+    Tool(
+        name="get_image_info", 
+        description="Get information about the current image",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "include_layers": {"type": "boolean", "description": "Include the full layer name list instead of just a count", "default": False}
+            }
+        }
+    ),
+    Tool(
+        name="run_procedure",
+        description="Run a GIMP procedure directly",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "procedure_name": {"type": "string", "description": "PDB procedure name"},
+                "arguments": {"type": "array", "description": "Procedure arguments"}
+            },
+            "required": ["procedure_name", "arguments"]
+        }
+    )
+)
+
+# Optional argument validation: the schemas above are compiled once here
+# so malformed tool calls fail with a clear message instead of a raw
+# KeyError from the handler
+try:
+    import jsonschema
+    _VALIDATORS = {tool.name: jsonschema.Draft7Validator(tool.inputSchema)
+                   for tool in _TOOLS}
+except ImportError:
+    _VALIDATORS = {}
+
+# Static resource payloads and error bodies, serialized once at import
+_PROCEDURES_JSON = json.dumps({"procedures": [
+    "gimp-image-new",
+    "gimp-file-load",
+    "gimp-file-save",
+    "gimp-layer-new",
+    "gimp-image-insert-layer",
+    "plug-in-gauss",
+    "gimp-drawable-brightness-contrast",
+    "gimp-drawable-hue-saturation",
+    "gimp-image-select-rectangle"
+]})
+_NO_BRUSHES_JSON = json.dumps({"brushes": []})
+_ERR_NOT_AVAILABLE = json.dumps({"error": "GIMP not available"})
+_ERR_NOT_FOUND = json.dumps({"error": "Resource not found"})
 
 logger = logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=256)
+def _color_for(name: str):
+    """Gegl.Color for a CSS color name, parsed once per distinct name
+
+    Cached colors are shared and must be treated as read-only; callers
+    that mutate a Color should construct their own.
+    """
+    return Gegl.Color.new(name)
+
+# Image resource URIs are parsed on the hot read path; slicing off a
+# known prefix avoids the list that uri.split("/") would allocate
+_IMG_PREFIX = "gimp://image/"
+_IMG_PREFIX_LEN = len(_IMG_PREFIX)
+
+def _text(msg: str) -> List[TextContent]:
+    """One-item text response used by every tool
+
+    model_construct skips pydantic re-validation of the two known-safe
+    fields on the hot return path.
+    """
+    return [TextContent.model_construct(type="text", text=msg)]
+
+# Shared degraded-mode response: built once instead of per rejected call
+_GIMP_UNAVAILABLE_RESP = _text("Error: GIMP not available or not initialized")
+
+@asynccontextmanager
+async def bounded_stdio_server(max_buffer_size: int = 64):
+    """stdio_server with bounded message buffers
+
+    The stock stdio_server creates its internal memory streams with an
+    unbounded buffer, so a burst of requests queues without limit while
+    slow GIMP operations drain. While the streams are being created this
+    points anyio.create_memory_object_stream at a bounded variant, which
+    applies backpressure to producers instead of growing the queue.
+    """
+    original = anyio.create_memory_object_stream
+
+    class _BoundedCreate:
+        def __call__(self, _max_buffer_size=0, *args, **kwargs):
+            kwargs.pop("max_buffer_size", None)
+            return original(max_buffer_size, *args, **kwargs)
+
+        def __getitem__(self, _item):
+            # Mirror the subscripted create_memory_object_stream[...] form
+            return self
+
+    anyio.create_memory_object_stream = _BoundedCreate()
+    try:
+        async with stdio_server() as streams:
+            # Streams exist now; undo the patch before handing control back
+            anyio.create_memory_object_stream = original
+            yield streams
+    finally:
+        anyio.create_memory_object_stream = original
+
 class GimpMCPServer:
+    # Slot storage: the per-call handlers hit self.* constantly, and the
+    # attribute set is fixed at init time anyway
+    __slots__ = (
+        "server", "current_image", "current_drawable", "pdb",
+        "_run_proc", "_SUCCESS", "_NONINTERACTIVE",
+        "_image_has_get_name", "_image_has_set_name",
+        "_LAYER_TYPE_MAP", "_BLEND_MODE_MAP", "_HUE_CHANNEL_MAP",
+        "_CHANNEL_OPS_MAP", "_INTERP_MAP",
+        "_static_tools", "_static_resources",
+        "_image_epoch", "_resources_cache",
+        "_layer_epoch", "_layer_names_cache",
+        "_image_count", "_brushes_cache", "_gimp_executor",
+        "_tool_handlers", "_resource_handlers"
+    )
+
     def __init__(self):
         self.server = Server("gimp-mcp-server")
         self.current_image = None
         self.current_drawable = None
         self.pdb = None
+        self._run_proc = None
+        self._SUCCESS = None
+        self._NONINTERACTIVE = None
+        self._image_has_get_name = False
+        self._image_has_set_name = False
+        self._LAYER_TYPE_MAP = {}
+        self._BLEND_MODE_MAP = {}
+        self._HUE_CHANNEL_MAP = {}
+        self._CHANNEL_OPS_MAP = {}
+        self._INTERP_MAP = {}
+
+        # Static descriptors are pure data: build them once and serve
+        # them by reference instead of reallocating per list request
+        self._static_tools = list(_TOOLS)
+        self._static_resources = [
+            Resource(
+                uri="gimp://images",
+                name="Open Images",
+                description="All open images as one compact table",
+                mimeType="application/json"
+            ),
+            Resource(
+                uri="gimp://procedures",
+                name="GIMP Procedures",
+                description="Available GIMP procedures via PDB",
+                mimeType="application/json"
+            ),
+            Resource(
+                uri="gimp://brushes",
+                name="GIMP Brushes",
+                description="Available GIMP brushes",
+                mimeType="application/json"
+            )
+        ]
+
+        # Image-derived resources only change when an image is created
+        # or opened; the epoch invalidates the memoized listing
+        self._image_epoch = 0
+        self._resources_cache = (-1, [])
+
+        # Layer-name lists cross GI once per layer change, not per poll;
+        # keyed by image identity and guarded by a change epoch
+        self._layer_epoch = 0
+        self._layer_names_cache = {}
+
+        # Mirror of how many images this server has opened or created;
+        # lets idle listing skip Gimp.list_images() entirely. Images
+        # closed inside GIMP are not observed, so this can overcount -
+        # that only costs the skipped shortcut, never a wrong listing.
+        self._image_count = 0
+
+        # Serialized brush list; marshalling the name array across GI is
+        # the expensive part, so keep the JSON until a brush-affecting
+        # procedure invalidates it
+        self._brushes_cache = None
+
+        # Long GIMP calls run on this single worker so the session's
+        # receive loop keeps servicing messages meanwhile; one worker
+        # because the PDB is not thread-safe
+        self._gimp_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
+        # Bound-method dispatch table: one dict probe per call instead
+        # of walking an if/elif chain and re-resolving the attribute
+        self._tool_handlers = {
+            "create_image": self.create_image,
+            "open_image": self.open_image,
+            "load_into_image": self.load_into_image,
+            "save_image": self.save_image,
+            "create_layer": self.create_layer,
+            "apply_gaussian_blur": self.apply_gaussian_blur,
+            "adjust_brightness_contrast": self.adjust_brightness_contrast,
+            "adjust_hue_saturation": self.adjust_hue_saturation,
+            "select_rectangle": self.select_rectangle,
+            "scale_image": self.scale_image,
+            "get_image_info": self.get_image_info,
+            "run_procedure": self.run_procedure
+        }
+
+        # Fixed resource URIs dispatch the same way
+        self._resource_handlers = {
+            "gimp://images": self._read_images,
+            "gimp://procedures": self._read_procedures,
+            "gimp://brushes": self._read_brushes
+        }
+
         self.setup_handlers()
         
     def setup_handlers(self):
@@ -55,263 +434,97 @@ class GimpMCPServer:
         @self.server.list_resources()
         async def list_resources() -> List[Resource]:
             """List available GIMP resources"""
-            resources = []
-            
-            if GIMP_AVAILABLE and self.pdb:
-                # List open images
-                image_list = Gimp.list_images()
-                for i, image in enumerate(image_list):
-                    if image:
-                        resources.append(Resource(
-                            uri=f"gimp://image/{i}",
-                            name=f"Image {i}: {image.get_name() if hasattr(image, 'get_name') else 'Untitled'}",
-                            description=f"GIMP image: {image.get_width()}x{image.get_height()}",
-                            mimeType="image/png"
-                        ))
-                
-                # List available procedures
-                resources.append(Resource(
-                    uri="gimp://procedures",
-                    name="GIMP Procedures",
-                    description="Available GIMP procedures via PDB",
-                    mimeType="application/json"
-                ))
-                
-                # List brushes, patterns, etc.
-                resources.append(Resource(
-                    uri="gimp://brushes",
-                    name="GIMP Brushes", 
-                    description="Available GIMP brushes",
-                    mimeType="application/json"
-                ))
-                
+            if self.pdb is None:
+                return []
+
+            # Serve the memoized listing until an image-changing tool
+            # bumps the epoch; idle polling then costs one tuple compare
+            epoch, cached = self._resources_cache
+            if epoch == self._image_epoch:
+                return cached
+
+            # Nothing opened yet (the idle state right after startup):
+            # serve the static resources without a GI call
+            if self._image_count == 0:
+                return self._static_resources
+
+            # One walk over the image list, built in a comprehension
+            resources = [
+                Resource(
+                    uri=f"gimp://image/{i}",
+                    name=f"Image {i}: {image.get_name() if self._image_has_get_name else 'Untitled'}",
+                    description=f"GIMP image: {image.get_width()}x{image.get_height()}",
+                    mimeType="image/png"
+                )
+                for i, image in enumerate(Gimp.list_images()) if image
+            ]
+
+            # Procedures, brushes, patterns, etc. never change shape
+            resources.extend(self._static_resources)
+
+            self._resources_cache = (self._image_epoch, resources)
             return resources
         
         @self.server.read_resource()
         async def read_resource(uri: str) -> str:
             """Read a GIMP resource"""
-            if not GIMP_AVAILABLE or not self.pdb:
-                return json.dumps({"error": "GIMP not available"})
+            if self.pdb is None:
+                return _ERR_NOT_AVAILABLE
                 
-            if uri.startswith("gimp://image/"):
-                image_id = int(uri.split("/")[-1])
+            if uri.startswith(_IMG_PREFIX):
+                image_id = int(uri[_IMG_PREFIX_LEN:])
                 image_list = Gimp.list_images()
                 if image_id < len(image_list) and image_list[image_id]:
                     image = image_list[image_id]
-                    layers = image.list_layers()
-                    return json.dumps({
-                        "name": image.get_name() if hasattr(image, 'get_name') else "Untitled",
+                    return _dump_json({
+                        "name": image.get_name() if self._image_has_get_name else "Untitled",
                         "width": image.get_width(),
                         "height": image.get_height(),
-                        "layers": [layer.get_name() for layer in layers if layer],
+                        "layers": self._layer_names(image),
                         "base_type": str(image.get_base_type()),
                         "precision": str(image.get_precision())
                     })
-                    
-            elif uri == "gimp://procedures":
-                # Get some common procedures
-                procedures = [
-                    "gimp-image-new",
-                    "gimp-file-load",
-                    "gimp-file-save", 
-                    "gimp-layer-new",
-                    "gimp-image-insert-layer",
-                    "plug-in-gauss",
-                    "gimp-drawable-brightness-contrast",
-                    "gimp-drawable-hue-saturation",
-                    "gimp-image-select-rectangle"
-                ]
-                return json.dumps({"procedures": procedures})
-                
-            elif uri == "gimp://brushes":
-                try:
-                    brushes_list = Gimp.brushes_get_list("")
-                    if brushes_list and len(brushes_list) > 1:
-                        return json.dumps({"brushes": brushes_list[1]})
-                except:
-                    pass
-                return json.dumps({"brushes": []})
-                
-            return json.dumps({"error": "Resource not found"})
+                return _ERR_NOT_FOUND
+
+            # Fixed URIs dispatch through a dict, same shape as the
+            # call_tool handler table
+            handler = self._resource_handlers.get(uri)
+            if handler is not None:
+                return handler()
+
+            return _ERR_NOT_FOUND
         
         @self.server.list_tools()
         async def list_tools() -> List[Tool]:
             """List available GIMP tools for Claude Code"""
-            return [
-                Tool(
-                    name="create_image",
-                    description="Create a new GIMP image",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "width": {"type": "integer", "description": "Image width in pixels"},
-                            "height": {"type": "integer", "description": "Image height in pixels"},
-                            "name": {"type": "string", "description": "Image name", "default": "Untitled"},
-                            "fill_type": {"type": "string", "enum": ["white", "black", "transparent"], "default": "white"}
-                        },
-                        "required": ["width", "height"]
-                    }
-                ),
-                Tool(
-                    name="open_image",
-                    description="Open an image file in GIMP",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "filepath": {"type": "string", "description": "Path to image file"}
-                        },
-                        "required": ["filepath"]
-                    }
-                ),
-                Tool(
-                    name="save_image",
-                    description="Save current image to file",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "filepath": {"type": "string", "description": "Output file path"},
-                            "export_options": {"type": "object", "description": "Export options (quality, compression, etc.)"}
-                        },
-                        "required": ["filepath"]
-                    }
-                ),
-                Tool(
-                    name="create_layer",
-                    description="Create a new layer in the current image",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "name": {"type": "string", "description": "Layer name"},
-                            "layer_type": {"type": "string", "enum": ["RGB", "RGBA", "GRAY", "GRAYA"], "default": "RGBA"},
-                            "opacity": {"type": "number", "minimum": 0, "maximum": 100, "default": 100},
-                            "mode": {"type": "string", "description": "Blend mode", "default": "normal"}
-                        },
-                        "required": ["name"]
-                    }
-                ),
-                Tool(
-                    name="apply_gaussian_blur",
-                    description="Apply Gaussian blur filter",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "radius": {"type": "number", "minimum": 0.1, "maximum": 300, "description": "Blur radius"},
-                            "horizontal": {"type": "number", "minimum": 0.1, "maximum": 300, "description": "Horizontal radius (optional)"},
-                            "vertical": {"type": "number", "minimum": 0.1, "maximum": 300, "description": "Vertical radius (optional)"}
-                        },
-                        "required": ["radius"]
-                    }
-                ),
-                Tool(
-                    name="adjust_brightness_contrast",
-                    description="Adjust brightness and contrast",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "brightness": {"type": "number", "minimum": -100, "maximum": 100, "description": "Brightness adjustment"},
-                            "contrast": {"type": "number", "minimum": -100, "maximum": 100, "description": "Contrast adjustment"}
-                        },
-                        "required": ["brightness", "contrast"]
-                    }
-                ),
-                Tool(
-                    name="adjust_hue_saturation",
-                    description="Adjust hue, saturation, and lightness",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "hue": {"type": "number", "minimum": -180, "maximum": 180, "description": "Hue adjustment"},
-                            "saturation": {"type": "number", "minimum": -100, "maximum": 100, "description": "Saturation adjustment"},
-                            "lightness": {"type": "number", "minimum": -100, "maximum": 100, "description": "Lightness adjustment"},
-                            "channel": {"type": "string", "enum": ["master", "red", "yellow", "green", "cyan", "blue", "magenta"], "default": "master"}
-                        }
-                    }
-                ),
-                Tool(
-                    name="select_rectangle",
-                    description="Create a rectangular selection",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "x": {"type": "number", "description": "X coordinate"},
-                            "y": {"type": "number", "description": "Y coordinate"},
-                            "width": {"type": "number", "description": "Selection width"},
-                            "height": {"type": "number", "description": "Selection height"},
-                            "operation": {"type": "string", "enum": ["replace", "add", "subtract", "intersect"], "default": "replace"}
-                        },
-                        "required": ["x", "y", "width", "height"]
-                    }
-                ),
-                Tool(
-                    name="scale_image",
-                    description="Scale the current image",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "width": {"type": "integer", "minimum": 1, "description": "New width"},
-                            "height": {"type": "integer", "minimum": 1, "description": "New height"},
-                            "interpolation": {"type": "string", "enum": ["none", "linear", "cubic", "nohalo", "lohalo"], "default": "cubic"}
-                        },
-                        "required": ["width", "height"]
-                    }
-                ),
-                Tool(
-                    name="get_image_info", 
-                    description="Get information about the current image",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {}
-                    }
-                ),
-                Tool(
-                    name="run_procedure",
-                    description="Run a GIMP procedure directly",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "procedure_name": {"type": "string", "description": "PDB procedure name"},
-                            "arguments": {"type": "array", "description": "Procedure arguments"}
-                        },
-                        "required": ["procedure_name", "arguments"]
-                    }
-                )
-            ]
+            # The descriptors are pure data; serve the list built at
+            # init time instead of reallocating it per request
+            return self._static_tools
         
         @self.server.call_tool()
         async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
             """Execute GIMP operations"""
-            if not GIMP_AVAILABLE or not self.pdb:
-                return [TextContent(type="text", text="Error: GIMP not available or not initialized")]
+            if self.pdb is None:
+                return _GIMP_UNAVAILABLE_RESP
                 
             try:
-                if name == "create_image":
-                    return await self.create_image(arguments)
-                elif name == "open_image":
-                    return await self.open_image(arguments)
-                elif name == "save_image":
-                    return await self.save_image(arguments)
-                elif name == "create_layer":
-                    return await self.create_layer(arguments)
-                elif name == "apply_gaussian_blur":
-                    return await self.apply_gaussian_blur(arguments)
-                elif name == "adjust_brightness_contrast":
-                    return await self.adjust_brightness_contrast(arguments)
-                elif name == "adjust_hue_saturation":
-                    return await self.adjust_hue_saturation(arguments)
-                elif name == "select_rectangle":
-                    return await self.select_rectangle(arguments)
-                elif name == "scale_image":
-                    return await self.scale_image(arguments)
-                elif name == "get_image_info":
-                    return await self.get_image_info(arguments)
-                elif name == "run_procedure":
-                    return await self.run_procedure(arguments)
-                else:
-                    return [TextContent(type="text", text=f"Unknown tool: {name}")]
-                    
+                # Tool names arrive from parsed JSON; interning turns the
+                # dict probe into a pointer compare against the literal keys
+                handler = self._tool_handlers.get(sys.intern(name))
+                if handler is None:
+                    return _text(f"Unknown tool: {name}")
+
+                validator = _VALIDATORS.get(name)
+                if validator is not None:
+                    errors = list(validator.iter_errors(arguments))
+                    if errors:
+                        return _text(f"Invalid arguments: {errors[0].message}")
+
+                return await handler(arguments)
+
             except Exception as e:
                 logger.error(f"Error executing tool {name}: {e}")
-                return [TextContent(type="text", text=f"Error: {str(e)}")]
+                return _text(f"Error: {str(e)}")
     
     async def create_image(self, args: Dict[str, Any]) -> List[TextContent]:
         """Create a new GIMP image using GIMP 3.0 API"""
@@ -324,7 +537,7 @@ class GimpMCPServer:
             # Create new image - GIMP 3.0 API
             image = Gimp.Image.new(width, height, Gimp.ImageBaseType.RGB)
             
-            if hasattr(image, 'set_name'):
+            if self._image_has_set_name:
                 image.set_name(name)
             
             # Create background layer
@@ -334,14 +547,10 @@ class GimpMCPServer:
             # Insert layer into image
             image.insert_layer(layer, None, 0)
             
-            # Fill layer based on type
-            if fill_type == "white":
-                white_color = Gegl.Color.new("white")
-                Gimp.Context.set_foreground(white_color)
-                Gimp.drawable_edit_fill(layer, Gimp.FillType.FOREGROUND)
-            elif fill_type == "black":
-                black_color = Gegl.Color.new("black")
-                Gimp.Context.set_foreground(black_color)
+            # Fill layer based on type; the two color fills differ only
+            # in the color name, which _color_for resolves
+            if fill_type in ("white", "black"):
+                Gimp.Context.set_foreground(_color_for(fill_type))
                 Gimp.drawable_edit_fill(layer, Gimp.FillType.FOREGROUND)
             elif fill_type == "transparent":
                 Gimp.drawable_edit_clear(layer)
@@ -352,26 +561,32 @@ class GimpMCPServer:
             # Update current references
             self.current_image = image
             self.current_drawable = layer
-            
-            return [TextContent(type="text", text=f"Created new image: {name} ({width}x{height})")]
+            self._image_epoch += 1
+            self._layer_epoch += 1
+            self._image_count += 1
+
+            return _text(f"Created new image: {name} ({width}x{height})")
             
         except Exception as e:
-            return [TextContent(type="text", text=f"Error creating image: {str(e)}")]
+            return _text(f"Error creating image: {str(e)}")
     
     async def open_image(self, args: Dict[str, Any]) -> List[TextContent]:
         """Open an image file using GIMP 3.0 API"""
         filepath = args["filepath"]
-        
-        if not os.path.exists(filepath):
-            return [TextContent(type="text", text=f"File not found: {filepath}")]
-        
+
+        # The Gio.File is needed for loading anyway; checking existence
+        # through it saves a separate Python-level stat
+        file_obj = Gio.File.new_for_path(filepath)
+        if not file_obj.query_exists(None):
+            return _text(f"File not found: {filepath}")
+
         try:
             # Open image using GIMP 3.0 file loading
-            file_obj = Gio.File.new_for_path(filepath)
-            image = Gimp.file_load(Gimp.RunMode.NONINTERACTIVE, file_obj)
+            image = await self._in_gimp_thread(
+                Gimp.file_load, self._NONINTERACTIVE, file_obj)
             
             if not image:
-                return [TextContent(type="text", text=f"Failed to load image: {filepath}")]
+                return _text(f"Failed to load image: {filepath}")
             
             # Create display
             display = Gimp.Display.new(image)
@@ -381,18 +596,58 @@ class GimpMCPServer:
             layers = image.list_layers()
             if layers:
                 self.current_drawable = layers[0]
-            
-            return [TextContent(type="text", text=f"Opened image: {filepath}")]
+            self._image_epoch += 1
+            self._layer_epoch += 1
+            self._image_count += 1
+
+            return _text(f"Opened image: {filepath}")
             
         except Exception as e:
-            return [TextContent(type="text", text=f"Error opening image: {str(e)}")]
-    
+            return _text(f"Error opening image: {str(e)}")
+
+    async def load_into_image(self, args: Dict[str, Any]) -> List[TextContent]:
+        """Load a file into the current image in place of its layers using GIMP 3.0 API"""
+        filepath = args["filepath"]
+
+        if not self.current_image:
+            return _text("Error: No active image")
+
+        file_obj = Gio.File.new_for_path(filepath)
+        if not file_obj.query_exists(None):
+            return _text(f"File not found: {filepath}")
+
+        try:
+            # Load file as a layer of the current image - GIMP 3.0 API
+            layer = await self._in_gimp_thread(
+                Gimp.file_load_layer, self._NONINTERACTIVE,
+                self.current_image, file_obj)
+
+            # Drop previous layers so the canvas holds only the new pixels
+            for old_layer in self.current_image.list_layers():
+                self.current_image.remove_layer(old_layer)
+
+            self.current_image.insert_layer(layer, None, 0)
+
+            # Match the canvas to the loaded file so exports come out at
+            # the file's own size, same as the open_image path
+            self.current_image.resize(layer.get_width(), layer.get_height(), 0, 0)
+            layer.set_offsets(0, 0)
+
+            self.current_drawable = layer
+            self._image_epoch += 1
+            self._layer_epoch += 1
+
+            return _text(f"Loaded into current image: {filepath}")
+
+        except Exception as e:
+            return _text(f"Error loading into image: {str(e)}")
+
     async def save_image(self, args: Dict[str, Any]) -> List[TextContent]:
         """Save image to file using GIMP 3.0 API"""
         filepath = args["filepath"]
         
         if not self.current_image:
-            return [TextContent(type="text", text="No image to save")]
+            return _text("No image to save")
         
         try:
             # Get all drawables for export
@@ -400,17 +655,19 @@ class GimpMCPServer:
             
             # Export image using GIMP 3.0 export API
             file_obj = Gio.File.new_for_path(filepath)
-            Gimp.file_export(Gimp.RunMode.NONINTERACTIVE, self.current_image, drawables, file_obj)
+            await self._in_gimp_thread(
+                Gimp.file_export, self._NONINTERACTIVE,
+                self.current_image, drawables, file_obj)
             
-            return [TextContent(type="text", text=f"Saved image to: {filepath}")]
+            return _text(f"Saved image to: {filepath}")
             
         except Exception as e:
-            return [TextContent(type="text", text=f"Error saving image: {str(e)}")]
+            return _text(f"Error saving image: {str(e)}")
     
     async def create_layer(self, args: Dict[str, Any]) -> List[TextContent]:
         """Create a new layer using GIMP 3.0 API"""
         if not self.current_image:
-            return [TextContent(type="text", text="No image open")]
+            return _text("No image open")
         
         name = args["name"]
         layer_type = args.get("layer_type", "RGBA")
@@ -418,26 +675,12 @@ class GimpMCPServer:
         mode = args.get("mode", "normal")
         
         try:
-            # Map layer type to GIMP 3.0 constants
-            type_map = {
-                "RGB": Gimp.ImageType.RGB_IMAGE,
-                "RGBA": Gimp.ImageType.RGBA_IMAGE,
-                "GRAY": Gimp.ImageType.GRAY_IMAGE,
-                "GRAYA": Gimp.ImageType.GRAYA_IMAGE
-            }
-            
-            # Map blend mode
-            mode_map = {
-                "normal": Gimp.LayerMode.NORMAL,
-                "multiply": Gimp.LayerMode.MULTIPLY,
-                "screen": Gimp.LayerMode.SCREEN,
-                "overlay": Gimp.LayerMode.OVERLAY,
-                "soft_light": Gimp.LayerMode.SOFTLIGHT_MODE,
-                "hard_light": Gimp.LayerMode.HARDLIGHT_MODE
-            }
-            
-            gimp_type = type_map.get(layer_type, Gimp.ImageType.RGBA_IMAGE)
-            gimp_mode = mode_map.get(mode, Gimp.LayerMode.NORMAL)
+            # Map layer type and blend mode through the precomputed
+            # GIMP 3.0 constant tables
+            # Interning makes the probe a pointer compare against the
+            # literal keys
+            gimp_type = self._LAYER_TYPE_MAP.get(sys.intern(layer_type), self._LAYER_TYPE_MAP["RGBA"])
+            gimp_mode = self._BLEND_MODE_MAP.get(mode, self._BLEND_MODE_MAP["normal"])
             
             # Create layer
             layer = Gimp.Layer.new(self.current_image, name,
@@ -450,16 +693,17 @@ class GimpMCPServer:
             
             # Update current drawable
             self.current_drawable = layer
-            
-            return [TextContent(type="text", text=f"Created layer: {name}")]
+            self._layer_epoch += 1
+
+            return _text(f"Created layer: {name}")
             
         except Exception as e:
-            return [TextContent(type="text", text=f"Error creating layer: {str(e)}")]
+            return _text(f"Error creating layer: {str(e)}")
     
     async def apply_gaussian_blur(self, args: Dict[str, Any]) -> List[TextContent]:
         """Apply Gaussian blur using GIMP 3.0 API"""
         if not self.current_drawable:
-            return [TextContent(type="text", text="No drawable selected")]
+            return _text("No drawable selected")
         
         radius = args["radius"]
         horizontal = args.get("horizontal", radius)
@@ -467,8 +711,9 @@ class GimpMCPServer:
         
         try:
             # Use GIMP 3.0 procedure call
-            result = self.pdb.run_procedure("plug-in-gauss",
-                                          [Gimp.RunMode.NONINTERACTIVE,
+            result = await self._in_gimp_thread(
+                                          self._run_proc, "plug-in-gauss",
+                                          [self._NONINTERACTIVE,
                                            self.current_image,
                                            1,
                                            [self.current_drawable],
@@ -476,41 +721,42 @@ class GimpMCPServer:
                                            vertical,
                                            1])  # link horizontal/vertical
             
-            if result.index(0) == Gimp.PDBStatusType.SUCCESS:
-                return [TextContent(type="text", text=f"Applied Gaussian blur (radius: {radius})")]
+            if result.index(0) == self._SUCCESS:
+                return _text(f"Applied Gaussian blur (radius: {radius})")
             else:
-                return [TextContent(type="text", text="Failed to apply Gaussian blur")]
+                return _text("Failed to apply Gaussian blur")
                 
-        except Exception as e:
-            return [TextContent(type="text", text=f"Error applying blur: {str(e)}")]
+        except GLib.Error as e:
+            return _text(f"Error applying blur: {str(e)}")
     
     async def adjust_brightness_contrast(self, args: Dict[str, Any]) -> List[TextContent]:
         """Adjust brightness and contrast using GIMP 3.0 API"""
         if not self.current_drawable:
-            return [TextContent(type="text", text="No drawable selected")]
+            return _text("No drawable selected")
         
         brightness = args["brightness"]
         contrast = args["contrast"]
         
         try:
             # Use GIMP 3.0 procedure call
-            result = self.pdb.run_procedure("gimp-drawable-brightness-contrast",
+            result = await self._in_gimp_thread(
+                                          self._run_proc, "gimp-drawable-brightness-contrast",
                                           [self.current_drawable,
                                            brightness / 100.0,  # Convert to -1.0 to 1.0 range
                                            contrast / 100.0])
             
-            if result.index(0) == Gimp.PDBStatusType.SUCCESS:
-                return [TextContent(type="text", text=f"Adjusted brightness: {brightness}, contrast: {contrast}")]
+            if result.index(0) == self._SUCCESS:
+                return _text(f"Adjusted brightness: {brightness}, contrast: {contrast}")
             else:
-                return [TextContent(type="text", text="Failed to adjust brightness/contrast")]
+                return _text("Failed to adjust brightness/contrast")
                 
-        except Exception as e:
-            return [TextContent(type="text", text=f"Error adjusting brightness/contrast: {str(e)}")]
+        except GLib.Error as e:
+            return _text(f"Error adjusting brightness/contrast: {str(e)}")
     
     async def adjust_hue_saturation(self, args: Dict[str, Any]) -> List[TextContent]:
         """Adjust hue, saturation, lightness using GIMP 3.0 API"""
         if not self.current_drawable:
-            return [TextContent(type="text", text="No drawable selected")]
+            return _text("No drawable selected")
         
         hue = args.get("hue", 0)
         saturation = args.get("saturation", 0)
@@ -518,21 +764,12 @@ class GimpMCPServer:
         channel = args.get("channel", "master")
         
         try:
-            # Map channel to GIMP 3.0 constants
-            channel_map = {
-                "master": Gimp.HueRange.ALL,
-                "red": Gimp.HueRange.RED,
-                "yellow": Gimp.HueRange.YELLOW,
-                "green": Gimp.HueRange.GREEN,
-                "cyan": Gimp.HueRange.CYAN,
-                "blue": Gimp.HueRange.BLUE,
-                "magenta": Gimp.HueRange.MAGENTA
-            }
-            
-            gimp_channel = channel_map.get(channel, Gimp.HueRange.ALL)
+            # Map channel through the precomputed GIMP 3.0 constant table
+            gimp_channel = self._HUE_CHANNEL_MAP.get(channel, self._HUE_CHANNEL_MAP["master"])
             
             # Use GIMP 3.0 procedure call
-            result = self.pdb.run_procedure("gimp-drawable-hue-saturation",
+            result = await self._in_gimp_thread(
+                                          self._run_proc, "gimp-drawable-hue-saturation",
                                           [self.current_drawable,
                                            gimp_channel,
                                            hue,
@@ -540,18 +777,18 @@ class GimpMCPServer:
                                            saturation,
                                            0])  # overlap
             
-            if result.index(0) == Gimp.PDBStatusType.SUCCESS:
-                return [TextContent(type="text", text=f"Adjusted hue: {hue}, saturation: {saturation}, lightness: {lightness}")]
+            if result.index(0) == self._SUCCESS:
+                return _text(f"Adjusted hue: {hue}, saturation: {saturation}, lightness: {lightness}")
             else:
-                return [TextContent(type="text", text="Failed to adjust hue/saturation")]
+                return _text("Failed to adjust hue/saturation")
                 
-        except Exception as e:
-            return [TextContent(type="text", text=f"Error adjusting hue/saturation: {str(e)}")]
+        except GLib.Error as e:
+            return _text(f"Error adjusting hue/saturation: {str(e)}")
     
     async def select_rectangle(self, args: Dict[str, Any]) -> List[TextContent]:
         """Create rectangular selection using GIMP 3.0 API"""
         if not self.current_image:
-            return [TextContent(type="text", text="No image open")]
+            return _text("No image open")
         
         x = args["x"]
         y = args["y"] 
@@ -560,75 +797,67 @@ class GimpMCPServer:
         operation = args.get("operation", "replace")
         
         try:
-            # Map operation to GIMP 3.0 constants
-            op_map = {
-                "replace": Gimp.ChannelOps.REPLACE,
-                "add": Gimp.ChannelOps.ADD,
-                "subtract": Gimp.ChannelOps.SUBTRACT,
-                "intersect": Gimp.ChannelOps.INTERSECT
-            }
-            
-            gimp_op = op_map.get(operation, Gimp.ChannelOps.REPLACE)
+            # Map operation through the precomputed GIMP 3.0 constant table
+            gimp_op = self._CHANNEL_OPS_MAP.get(operation, self._CHANNEL_OPS_MAP["replace"])
             
             # Create rectangular selection
-            self.current_image.select_rectangle(gimp_op, x, y, width, height)
+            await self._in_gimp_thread(
+                self.current_image.select_rectangle, gimp_op, x, y, width, height)
             
-            return [TextContent(type="text", text=f"Created rectangular selection: {x},{y} {width}x{height}")]
+            return _text(f"Created rectangular selection: {x},{y} {width}x{height}")
             
-        except Exception as e:
-            return [TextContent(type="text", text=f"Error creating selection: {str(e)}")]
+        except GLib.Error as e:
+            return _text(f"Error creating selection: {str(e)}")
     
     async def scale_image(self, args: Dict[str, Any]) -> List[TextContent]:
         """Scale image using GIMP 3.0 API"""
         if not self.current_image:
-            return [TextContent(type="text", text="No image open")]
+            return _text("No image open")
         
         width = args["width"]
         height = args["height"]
         interpolation = args.get("interpolation", "cubic")
         
         try:
-            # Map interpolation to GIMP 3.0 constants
-            interp_map = {
-                "none": Gimp.InterpolationType.NONE,
-                "linear": Gimp.InterpolationType.LINEAR,
-                "cubic": Gimp.InterpolationType.CUBIC,
-                "nohalo": Gimp.InterpolationType.NOHALO,
-                "lohalo": Gimp.InterpolationType.LOHALO
-            }
-            
-            gimp_interp = interp_map.get(interpolation, Gimp.InterpolationType.CUBIC)
-            
-            # Scale image
-            self.current_image.scale(width, height)
+            # Map interpolation through the precomputed GIMP 3.0 constant table
+            gimp_interp = self._INTERP_MAP.get(interpolation, self._INTERP_MAP["cubic"])
             
-            return [TextContent(type="text", text=f"Scaled image to {width}x{height}")]
+            # Scale image; real raster work, so keep it off the loop
+            await self._in_gimp_thread(self.current_image.scale, width, height)
+
+            # The cached resource listing embeds the dimensions
+            self._image_epoch += 1
+
+            return _text(f"Scaled image to {width}x{height}")
             
-        except Exception as e:
-            return [TextContent(type="text", text=f"Error scaling image: {str(e)}")]
+        except GLib.Error as e:
+            return _text(f"Error scaling image: {str(e)}")
     
     async def get_image_info(self, args: Dict[str, Any]) -> List[TextContent]:
         """Get image information using GIMP 3.0 API"""
         if not self.current_image:
-            return [TextContent(type="text", text="No image open")]
+            return _text("No image open")
         
         try:
-            layers = self.current_image.list_layers()
-            
             info = {
-                "name": self.current_image.get_name() if hasattr(self.current_image, 'get_name') else "Untitled",
+                "name": self.current_image.get_name() if self._image_has_get_name else "Untitled",
                 "width": self.current_image.get_width(),
                 "height": self.current_image.get_height(),
                 "base_type": str(self.current_image.get_base_type()),
                 "precision": str(self.current_image.get_precision()),
-                "layers": [layer.get_name() for layer in layers if layer],
                 "active_layer": self.current_drawable.get_name() if self.current_drawable else None
             }
-            
-            return [TextContent(type="text", text=json.dumps(info, indent=2))]
+            # The full name list costs one GI call per layer; callers
+            # that only need the shape get a count
+            if args.get("include_layers", False):
+                info["layers"] = self._layer_names(self.current_image)
+            else:
+                info["layer_count"] = len(self.current_image.list_layers())
+
+            return _text(_dump_json(info))
             
         except Exception as e:
-            return [TextContent(type="text", text=f"Error getting image info: {str(e)}")]
+            return _text(f"Error getting image info: {str(e)}")
     
     async def run_procedure(self, args: Dict[str, Any]) -> List[TextContent]:
         """Run arbitrary GIMP procedure using GIMP 3.0 API"""
@@ -637,20 +866,130 @@ class GimpMCPServer:
         
         try:
             # Run procedure through PDB
-            result = self.pdb.run_procedure(procedure_name, arguments)
-            
-            if result.index(0) == Gimp.PDBStatusType.SUCCESS:
-                return [TextContent(type="text", text=f"Executed procedure: {procedure_name}")]
+            result = await self._in_gimp_thread(self._run_proc,
+                                                procedure_name, arguments)
+
+            # Brush-affecting procedures invalidate the serialized list;
+            # any procedure may have touched layers or created/deleted
+            # images, so drop those caches too. The count bump may
+            # overcount, which only costs the idle-listing shortcut.
+            if procedure_name.startswith(("gimp-brush", "gimp-brushes")):
+                self._brushes_cache = None
+            self._image_epoch += 1
+            self._layer_epoch += 1
+            self._image_count += 1
+
+            if result.index(0) == self._SUCCESS:
+                return _text(f"Executed procedure: {procedure_name}")
             else:
-                return [TextContent(type="text", text=f"Failed to execute procedure: {procedure_name}")]
+                return _text(f"Failed to execute procedure: {procedure_name}")
                 
-        except Exception as e:
-            return [TextContent(type="text", text=f"Error running procedure: {str(e)}")]
+        except GLib.Error as e:
+            return _text(f"Error running procedure: {str(e)}")
+
+    def _read_images(self) -> str:
+        """All open images as a column-header table
+
+        The header row is sent once and each image is a value tuple, so
+        the payload does not repeat the same keys per image.
+        """
+        return _dump_json({
+            "columns": ["id", "name", "width", "height"],
+            "rows": [
+                [i,
+                 image.get_name() if self._image_has_get_name else "Untitled",
+                 image.get_width(),
+                 image.get_height()]
+                for i, image in enumerate(Gimp.list_images()) if image
+            ]
+        })
+
+    def _read_procedures(self) -> str:
+        """Serve the static, pre-serialized procedure listing"""
+        return _PROCEDURES_JSON
+
+    def _read_brushes(self) -> str:
+        """Serve the brush listing, serialized once until invalidated"""
+        if self._brushes_cache is not None:
+            return self._brushes_cache
+        try:
+            brushes_list = Gimp.brushes_get_list("")
+            if brushes_list and len(brushes_list) > 1:
+                self._brushes_cache = _dump_json({"brushes": brushes_list[1]})
+                return self._brushes_cache
+        except:
+            pass
+        return _NO_BRUSHES_JSON
+
+    async def _in_gimp_thread(self, func, *args):
+        """Run a blocking GIMP call on the dedicated worker thread"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._gimp_executor, func, *args)
+
+    def _layer_names(self, image) -> List[str]:
+        """Layer names for an image, cached until the layer epoch moves"""
+        key = id(image)
+        cached = self._layer_names_cache.get(key)
+        if cached is not None and cached[0] == self._layer_epoch:
+            return cached[1]
+        names = [layer.get_name() for layer in image.list_layers() if layer]
+        self._layer_names_cache[key] = (self._layer_epoch, names)
+        return names
     
     def initialize_gimp(self):
         """Initialize GIMP for plugin execution"""
-        if GIMP_AVAILABLE:
+        if _ensure_gimp():
             self.pdb = Gimp.get_pdb()
+            # Resolve the hot GI attributes once; each access otherwise
+            # walks the introspection machinery again
+            self._run_proc = self.pdb.run_procedure
+            self._SUCCESS = Gimp.PDBStatusType.SUCCESS
+            self._NONINTERACTIVE = Gimp.RunMode.NONINTERACTIVE
+
+            # hasattr on a GI object is a hidden try/except through the
+            # introspection machinery; probe the class once instead
+            self._image_has_get_name = hasattr(Gimp.Image, "get_name")
+            self._image_has_set_name = hasattr(Gimp.Image, "set_name")
+
+            # String -> GI enum tables, resolved once instead of being
+            # rebuilt (with one GI lookup per entry) on every tool call
+            self._LAYER_TYPE_MAP = {
+                "RGB": Gimp.ImageType.RGB_IMAGE,
+                "RGBA": Gimp.ImageType.RGBA_IMAGE,
+                "GRAY": Gimp.ImageType.GRAY_IMAGE,
+                "GRAYA": Gimp.ImageType.GRAYA_IMAGE
+            }
+            self._BLEND_MODE_MAP = {
+                "normal": Gimp.LayerMode.NORMAL,
+                "multiply": Gimp.LayerMode.MULTIPLY,
+                "screen": Gimp.LayerMode.SCREEN,
+                "overlay": Gimp.LayerMode.OVERLAY,
+                "soft_light": Gimp.LayerMode.SOFTLIGHT_MODE,
+                "hard_light": Gimp.LayerMode.HARDLIGHT_MODE
+            }
+            self._HUE_CHANNEL_MAP = {
+                "master": Gimp.HueRange.ALL,
+                "red": Gimp.HueRange.RED,
+                "yellow": Gimp.HueRange.YELLOW,
+                "green": Gimp.HueRange.GREEN,
+                "cyan": Gimp.HueRange.CYAN,
+                "blue": Gimp.HueRange.BLUE,
+                "magenta": Gimp.HueRange.MAGENTA
+            }
+            self._CHANNEL_OPS_MAP = {
+                "replace": Gimp.ChannelOps.REPLACE,
+                "add": Gimp.ChannelOps.ADD,
+                "subtract": Gimp.ChannelOps.SUBTRACT,
+                "intersect": Gimp.ChannelOps.INTERSECT
+            }
+            self._INTERP_MAP = {
+                "none": Gimp.InterpolationType.NONE,
+                "linear": Gimp.InterpolationType.LINEAR,
+                "cubic": Gimp.InterpolationType.CUBIC,
+                "nohalo": Gimp.InterpolationType.NOHALO,
+                "lohalo": Gimp.InterpolationType.LOHALO
+            }
+
             # Set up context and other initialization
             Gimp.context_push()
             return True
@@ -662,7 +1001,7 @@ class GimpMCPServer:
             print("Warning: Running without GIMP initialization")
         
         # Run MCP server
-        async with stdio_server() as (read_stream, write_stream):
+        async with bounded_stdio_server() as (read_stream, write_stream):
             await self.server.run(read_stream, write_stream, 
                                 InitializationOptions(
                                     server_name="gimp-mcp-server",
@@ -674,7 +1013,10 @@ def main():
     """Main entry point"""
     logging.basicConfig(level=logging.INFO)
     server = GimpMCPServer()
-    asyncio.run(server.run())
+    if UVLOOP_AVAILABLE:
+        uvloop.run(server.run())
+    else:
+        asyncio.run(server.run())
 
 if __name__ == "__main__":
     main()
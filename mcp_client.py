@@ -9,6 +9,62 @@ import sys
 import subprocess
 from pathlib import Path
 
+# The Windows proactor loop busy-waits against the synchronous stdio
+# pipes MCP uses; the selector loop idles properly
+if sys.platform == "win32":
+    asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+
+# Optional libuv-backed event loop for the stdio-heavy client path
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+# Optional fast JSON codec; orjson emits bytes directly so a frame
+# needs no separate str -> bytes encode before the pipe write
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _dumps_line(msg) -> bytes:
+    """Serialize one JSON-RPC message to a newline-terminated frame"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(msg) + b'\n'
+    return (json.dumps(msg) + '\n').encode()
+
+async def _drain_stderr(stream):
+    """Forward server stderr so its pipe never fills and blocks the server"""
+    while True:
+        line = await stream.readline()
+        if not line:
+            break
+        sys.stderr.buffer.write(line)
+        sys.stderr.buffer.flush()
+
+def _loads(raw: bytes):
+    """Parse a response frame straight from bytes
+
+    Both codecs take bytes and ignore surrounding whitespace, so no
+    decode or strip pass is needed per message.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+async def _read_response(stream):
+    """Read and parse one response line; None when the server has exited
+
+    readline returns b"" at EOF, which is not a JSON document, so it is
+    checked before parsing instead of surfacing as a decode error.
+    """
+    raw = await stream.readline()
+    if not raw:
+        return None
+    return _loads(raw)
+
 async def create_image_via_mcp():
     """Create a 1920x1080 image using MCP client"""
     
@@ -32,11 +88,18 @@ async def create_image_via_mcp():
     # Wait a moment for GIMP to start
     await asyncio.sleep(3)
     
-    # Now try to run the MCP server
+    # Now try to run the MCP server; the async subprocess keeps pipe
+    # writes and reads off the event loop thread
     print("Starting MCP server...")
-    server_process = subprocess.Popen([
-        "python3", str(server_path)
-    ], env=env, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    server_process = await asyncio.create_subprocess_exec(
+        "python3", str(server_path), env=env,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE)
+
+    # Drain stderr concurrently; a chatty server would otherwise fill
+    # the pipe buffer and stall while we wait on stdout
+    stderr_task = asyncio.create_task(_drain_stderr(server_process.stderr))
     
     # Send MCP initialization
     init_message = {
@@ -53,11 +116,11 @@ async def create_image_via_mcp():
         }
     }
     
-    server_process.stdin.write((json.dumps(init_message) + '\n').encode())
-    server_process.stdin.flush()
+    server_process.stdin.write(_dumps_line(init_message))
+    await server_process.stdin.drain()
     
     # Read response
-    response = server_process.stdout.readline().decode().strip()
+    response = await _read_response(server_process.stdout)
     print(f"Init response: {response}")
     
     # Send create_image tool call
@@ -75,18 +138,23 @@ async def create_image_via_mcp():
         }
     }
     
-    server_process.stdin.write((json.dumps(create_message) + '\n').encode())
-    server_process.stdin.flush()
+    server_process.stdin.write(_dumps_line(create_message))
+    await server_process.stdin.drain()
     
     # Read response
-    response = server_process.stdout.readline().decode().strip()
+    response = await _read_response(server_process.stdout)
     print(f"Create image response: {response}")
     
     # Clean up
     server_process.terminate()
+    await server_process.wait()
+    stderr_task.cancel()
     
     return response
 
 if __name__ == "__main__":
     import os
-    asyncio.run(create_image_via_mcp())
\ No newline at end of file
+    if UVLOOP_AVAILABLE:
+        uvloop.run(create_image_via_mcp())
+    else:
+        asyncio.run(create_image_via_mcp())
\ No newline at end of file
@@ -8,6 +8,18 @@ import subprocess
 import sys
 import os
 
+# The Windows proactor loop busy-waits against the synchronous stdio
+# pipes MCP uses; the selector loop idles properly
+if sys.platform == "win32":
+    asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+
+# Optional libuv-backed event loop for the stdio-heavy client path
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 # Try to use the mcp library
 try:
     from mcp.client.stdio import stdio_client
@@ -70,4 +82,7 @@ async def create_image_direct():
         print("GIMP launched. Create image manually: File > New > 800x600")
 
 if __name__ == "__main__":
-    asyncio.run(create_image_direct())
\ No newline at end of file
+    if UVLOOP_AVAILABLE:
+        uvloop.run(create_image_direct())
+    else:
+        asyncio.run(create_image_direct())
\ No newline at end of file